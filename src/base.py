@@ -1,12 +1,29 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Query, Body
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Body, Request
+from fastapi.responses import StreamingResponse
 from configurations import collection, dlq_collection, config
 from databases.schemas import all_jobs
 from databases.models import Job
 from datetime import datetime, timezone
+from contextlib import asynccontextmanager
 from worker import start_workers, stop_workers
+from events import bus, collect_status, publish_transition
+from write_buffer import write_buffer
+import asyncio
+import json
 import threading
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Stop workers before the server exits so no transitions are buffered after the final flush.
+    stop_workers() flushes the write buffer and resets unfinished jobs to 'pending'.
+    """
+    yield
+    await asyncio.to_thread(stop_workers)
+    write_buffer.flush()
+
+
+app = FastAPI(lifespan=lifespan)
 router = APIRouter()
 
 
@@ -58,6 +75,7 @@ async def add_job(new_job: Job):
         }
 
         response = collection.insert_one(job_data)
+        publish_transition(job_data["id"], job_data["state"], job_data["attempts"])
         return {"status_code": 200,"status": "Insertion Successful","inserted_id": str(response.inserted_id)}
 
     except Exception as e:
@@ -86,6 +104,9 @@ async def update_job(new_job: Job):
         if response.modified_count == 0:
             raise HTTPException(status_code=400, detail="Updation Unsuccessful - No changes were made")
 
+        if "state" in update_data and update_data["state"] != existing_job.get("state"):
+            publish_transition(new_job.id, update_data["state"], update_data.get("attempts", existing_job.get("attempts")))
+
         return {"status_code": 200, "details": f"Updation Successful for job {new_job.id}"}
 
     except HTTPException:
@@ -132,38 +153,41 @@ def overall_status():
     """
 
     try:
-        total_jobs = collection.count_documents({})
-        pending_jobs = collection.count_documents({"state": "pending"})
-        processing_jobs = collection.count_documents({"state": "processing"})
-        completed_jobs = collection.count_documents({"state": "completed"})
-        failed_jobs = collection.count_documents({"state": "failed"})
-        dead_jobs = dlq_collection.count_documents({})
-
-        active_workers = len(set([
-            job.get("worker_assigned")
-            for job in collection.find({"state": "processing"}, {"worker_assigned": 1})
-            if job.get("worker_assigned") is not None
-        ]))
-
-        return {
-            "timestamp": current_iso_time(),
-            "summary": {
-                "total_jobs": total_jobs,
-                "pending": pending_jobs,
-                "processing": processing_jobs,
-                "completed": completed_jobs,
-                "failed": failed_jobs,
-                "dead": dead_jobs
-            },
-            "active_workers": active_workers,
-            "system_status": "healthy" if processing_jobs > 0 or pending_jobs > 0 else "idle"
-        }
+        return collect_status()
 
     except Exception as e:
         return {"error": f"Failed to fetch status: {e}"}
     
 
 
+@router.get("/events")
+async def stream_events(request: Request):
+    """
+    Stream job transitions and periodic status counters as server-sent events.
+    All watchers share one status poller, so extra watchers add no database load.
+    """
+
+    async def event_stream():
+        # Subscribe inside the generator so the finally runs even if the response is cancelled early.
+        subscriber = None
+        try:
+            subscriber = bus.subscribe()
+            queue = subscriber[1]
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {message['event']}\ndata: {json.dumps(message['data'])}\n\n"
+        finally:
+            if subscriber:
+                bus.unsubscribe(subscriber)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+
 @router.get("/dlq/list")
 def get_dlq_jobs():
     """
@@ -197,6 +221,7 @@ def retry_dlq_job(job_id: str = Query(..., description="ID of the job to retry f
        
         collection.insert_one(job)
         dlq_collection.delete_one({"id": job_id})
+        publish_transition(job_id, "pending", 0)
         return {"status": "success", "details": f"Job {job_id} added back to Main collection for retry!"}
     except HTTPException:
         raise
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from configurations import collection, dlq_collection
+
+STATUS_INTERVAL = 2.0   # seconds between aggregated status events
+QUEUE_SIZE = 1000       # per-watcher buffer; slow watchers drop events instead of blocking workers
+
+
+def current_iso_time():
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def collect_status():
+    """
+    Count jobs per state (five counts on the jobs collection, one on the DLQ)
+    and distinct active workers from the jobs currently processing.
+    """
+    pending_jobs = collection.count_documents({"state": "pending"})
+    processing_jobs = collection.count_documents({"state": "processing"})
+
+    active_workers = len(set([
+        job.get("worker_assigned")
+        for job in collection.find({"state": "processing"}, {"worker_assigned": 1})
+        if job.get("worker_assigned") is not None
+    ]))
+
+    return {
+        "timestamp": current_iso_time(),
+        "summary": {
+            "total_jobs": collection.count_documents({}),
+            "pending": pending_jobs,
+            "processing": processing_jobs,
+            "completed": collection.count_documents({"state": "completed"}),
+            "failed": collection.count_documents({"state": "failed"}),
+            "dead": dlq_collection.count_documents({})
+        },
+        "active_workers": active_workers,
+        "system_status": "healthy" if processing_jobs > 0 or pending_jobs > 0 else "idle"
+    }
+
+
+class EventBus:
+    """
+    Fan out job transitions and periodic status counters to every watcher.
+    A single ticker thread queries the database, however many watchers are connected.
+    """
+
+    def __init__(self, interval=STATUS_INTERVAL):
+        self.interval = interval
+        self.subscribers = set()
+        self.lock = threading.Lock()
+        self.ticker = None
+        self.last_status = None
+
+    def subscribe(self):
+        """
+        Register a watcher on the running event loop and return its handle.
+        """
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(maxsize=QUEUE_SIZE))
+        with self.lock:
+            self.subscribers.add(subscriber)
+            if self.last_status:
+                subscriber[1].put_nowait({"event": "status", "data": self.last_status})
+            if self.ticker is None:
+                self.ticker = threading.Thread(target=self._tick, daemon=True, name="EventBus-Ticker")
+                self.ticker.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.discard(subscriber)
+
+    def publish(self, event, data):
+        """
+        Deliver an event to all watchers. Safe to call from worker threads.
+        """
+        message = {"event": event, "data": data}
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, message)
+            except RuntimeError:
+                # Event loop already closed; the watcher is gone.
+                self.unsubscribe((loop, queue))
+
+    @staticmethod
+    def _offer(queue, message):
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            pass
+
+    def _tick(self):
+        """
+        Publish aggregated counters while anyone is watching, then exit.
+        """
+        while True:
+            with self.lock:
+                if not self.subscribers:
+                    self.ticker = None
+                    self.last_status = None
+                    return
+            try:
+                status = collect_status()
+                self.last_status = status
+                self.publish("status", status)
+            except Exception as e:
+                self.publish("error", {"detail": f"Failed to fetch status: {e}"})
+            time.sleep(self.interval)
+
+
+bus = EventBus()
+
+
+def publish_transition(job_id, state, attempts=None, worker_id=None, delay=None):
+    """
+    Publish a job state transition to all watchers.
+    Retries are published as state 'retrying' with the backoff delay in seconds.
+    """
+    data = {
+        "id": job_id,
+        "state": state,
+        "attempts": attempts,
+        "worker": worker_id,
+        "timestamp": current_iso_time()
+    }
+    if delay is not None:
+        data["delay"] = round(delay, 2)
+    bus.publish("transition", data)
@@ -167,6 +167,57 @@ def status():
         click.echo(f"Error fetching status: {e}")
 
 
+@cli.command(help="Watch job transitions and status counters live")
+def watch():
+    colors = {"pending": "cyan", "processing": "blue", "retrying": "yellow", "completed": "green", "failed": "magenta", "dead": "red"}
+    connected = False
+    try:
+        with requests.get(f"{BASE_URL}/events", stream=True, timeout=(5, 30)) as response:
+            if not response.ok:
+                click.secho(f"Error: {response.text}", fg="red")
+                return
+
+            click.secho("Watching queue events (Ctrl+C to stop)...", fg="cyan")
+            connected = True
+            event = None
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("event:"):
+                    event = line[len("event:"):].strip()
+                    continue
+                if not line.startswith("data:"):
+                    continue
+
+                data = json.loads(line[len("data:"):])
+                if event == "transition":
+                    details = f"attempts: {data.get('attempts')}"
+                    if data.get("delay") is not None:
+                        details += f", next attempt in {data['delay']}s"
+                    if data.get("worker"):
+                        details += f", worker: {data['worker']}"
+                    click.secho(f"[{data['timestamp']}] Job {data['id']} -> {data['state']} ({details})", fg=colors.get(data["state"], "white"))
+                elif event == "status":
+                    summary = data.get("summary", {})
+                    click.echo(
+                        f"[{data.get('timestamp')}] {data.get('system_status', 'unknown')} | "
+                        f"workers: {data.get('active_workers', 0)} | "
+                        f"total: {summary.get('total_jobs', 0)} pending: {summary.get('pending', 0)} "
+                        f"processing: {summary.get('processing', 0)} completed: {summary.get('completed', 0)} "
+                        f"failed: {summary.get('failed', 0)} dead: {summary.get('dead', 0)}"
+                    )
+                elif event == "error":
+                    click.secho(data.get("detail", "Unknown error"), fg="red")
+                event = None
+
+    except KeyboardInterrupt:
+        click.secho("\nStopped watching.", fg="yellow")
+    except requests.exceptions.RequestException as e:
+        # Read timeouts mid-stream surface as ConnectionError, so anything after connecting is a lost connection.
+        if connected or isinstance(e, requests.exceptions.ReadTimeout):
+            click.secho(f"Lost connection to server: {e}", fg="red")
+        else:
+            click.secho(f"Failed to connect to server: {e}", fg="red")
+
+
 @dlq.command(help="List all jobs in the Dead Letter Queue")
 def list():
     try:
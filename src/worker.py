@@ -1,6 +1,8 @@
 import subprocess
 from databases.models import Job
 from configurations import collection, dlq_collection , config
+from events import publish_transition
+from write_buffer import write_buffer
 import click
 from datetime import datetime, timezone
 import time
@@ -26,6 +28,7 @@ def schedule(worker_id, base_delay=2):
                 continue
 
             click.secho(f"Worker {worker_id} picked job {job['id']} -> {job['command']}", fg="blue")
+            publish_transition(job["id"], "processing", job.get("attempts", 0), worker_id)
 
             retries = job.get("attempts", 0)
             max_retries = job.get("max_retries", config.get("max_retries", 3))
@@ -57,33 +60,49 @@ def schedule(worker_id, base_delay=2):
                     if retries <= max_retries:
                         delay = min(base_delay ** retries + random.uniform(0, 1), 60)
                         click.secho(f"Retry {retries}/{max_retries} for job {job['id']} in {delay:.2f}s...", fg="yellow")
+                        publish_transition(job["id"], "retrying", retries, worker_id, delay)
                         time.sleep(delay)
-                        collection.update_one({"id": job["id"]}, {"$set": {"attempts": retries}})
+                        publish_transition(job["id"], "processing", retries, worker_id)
                         continue
                     else:
                         state = "dead"
-                        job_copy = dict(job)
-                        job_copy.pop("_id", None)
-                        if not dlq_collection.find_one({"id": job["id"]}):
-                            dlq_collection.insert_one(job_copy)
-                        collection.delete_one({"id": job["id"]})
+                        write_buffer.move_to_dlq({**job, "state": state, "attempts": retries, "updated_at": current_iso_time()})
                         click.secho(f"Job {job['id']} moved to DLQ after {max_retries} retries", fg="red")
                         break
 
-            collection.update_one({"id": job["id"]},{"$set": {"state": state, "attempts": retries, "updated_at": current_iso_time()}})
+            if state != "dead":
+                write_buffer.set_fields(job["id"], {"state": state, "attempts": retries, "updated_at": current_iso_time()})
+            publish_transition(job["id"], state, retries, worker_id)
             click.secho(f"Worker {worker_id} finished job {job['id']} -> Status: {state}", fg="green")
 
     finally:
-        updated = collection.update_many({"state": "processing", "worker_assigned": worker_id},{"$set": {"state": "failed", "updated_at": current_iso_time()}})
-        if updated.modified_count:
-            click.secho(f"Worker {worker_id} crashed — {updated.modified_count} jobs marked as failed", fg="red")
+        write_buffer.flush()
+        modified = move_processing_jobs({"worker_assigned": worker_id}, "failed")
+        if modified:
+            click.secho(f"Worker {worker_id} crashed — {modified} jobs marked as failed", fg="red")
+
+
+def move_processing_jobs(query, state):
+    """
+    Move 'processing' jobs matching the query to a new state and publish a transition for each one.
+    """
+    jobs = list(collection.find({**query, "state": "processing"}, {"id": 1, "attempts": 1, "worker_assigned": 1}))
+    if not jobs:
+        return 0
+    updated = collection.update_many(
+        {"id": {"$in": [job["id"] for job in jobs]}, "state": "processing"},
+        {"$set": {"state": state, "updated_at": current_iso_time()}}
+    )
+    for job in jobs:
+        publish_transition(job["id"], state, job.get("attempts", 0), job.get("worker_assigned"))
+    return updated.modified_count
 
 
 def start_workers(num_workers):
     """
     Start Worker Threads .
     """
-    stop_event = threading.Event()
+    stop_event.clear()
     try:
         for i in range(num_workers):
             time.sleep(random.uniform(0, 0.2))  
@@ -113,11 +132,8 @@ def stop_workers():
     
     for t in threads:
         t.join(timeout=3)
-        count += 1
-    updated = collection.update_many(
-        {"state": "processing"},
-        {"$set": {"state": "pending", "updated_at": current_iso_time()}}
-    )
+    write_buffer.flush()
+    move_processing_jobs({}, "pending")
     click.secho("All workers stopped gracefully after finishing current jobs.", fg="red")
 
 
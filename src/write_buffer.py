@@ -0,0 +1,152 @@
+import threading
+import click
+from pymongo import UpdateOne, ReplaceOne, DeleteOne
+from pymongo.errors import BulkWriteError, ConnectionFailure
+from configurations import collection, dlq_collection
+
+FLUSH_INTERVAL = 1.0    # seconds a buffered write may wait before reaching the database
+MAX_BATCH = 500         # buffered jobs that trigger an early flush
+MAX_FLUSH_RETRIES = 5   # failed flushes before a job's buffered writes are dropped
+
+
+class WriteBuffer:
+    """
+    Per-process write-behind buffer for worker state transitions.
+    Writes are coalesced per job and sent as periodic bulk_write batches.
+    """
+
+    def __init__(self, interval=FLUSH_INTERVAL, max_batch=MAX_BATCH):
+        self.interval = interval
+        self.max_batch = max_batch
+        self.updates = {}       # job id -> fields to $set on the main collection
+        self.dlq_moves = {}     # job id -> document to move into the DLQ
+        self.failures = {}      # job id -> consecutive flushes its writes failed in
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wake = threading.Event()
+        self.flusher = None
+
+    def set_fields(self, job_id, fields):
+        """
+        Buffer a $set on a job. Later fields for the same job overwrite earlier ones.
+        """
+        with self.lock:
+            self.updates.setdefault(job_id, {}).update(fields)
+            self._schedule()
+
+    def move_to_dlq(self, job):
+        """
+        Buffer moving a job into the DLQ. Pending updates for it are dropped, since the document is deleted.
+        """
+        job_copy = dict(job)
+        job_copy.pop("_id", None)
+        with self.lock:
+            self.updates.pop(job_copy["id"], None)
+            self.dlq_moves[job_copy["id"]] = job_copy
+            self._schedule()
+
+    def _schedule(self):
+        # Caller holds self.lock.
+        if self.flusher is None:
+            self.flusher = threading.Thread(target=self._run, daemon=True, name="WriteBuffer-Flusher")
+            self.flusher.start()
+        if len(self.updates) + len(self.dlq_moves) >= self.max_batch:
+            self.wake.set()
+
+    def _run(self):
+        while True:
+            self.wake.wait(self.interval)
+            self.wake.clear()
+            self.flush()
+
+    def flush(self):
+        """
+        Write all buffered transitions to the database.
+        Operations rejected by the server are re-buffered individually and dropped after MAX_FLUSH_RETRIES;
+        on connection errors the whole batch is put back for the next flush.
+        """
+        with self.flush_lock:
+            with self.lock:
+                updates, self.updates = self.updates, {}
+                dlq_moves, self.dlq_moves = self.dlq_moves, {}
+
+            if not updates and not dlq_moves:
+                return
+
+            try:
+                # Insert into the DLQ before deleting from the main collection, so a job is never lost.
+                moves = list(dlq_moves.items())
+                failed = self._bulk_write(dlq_collection, [ReplaceOne({"id": job_id}, job, upsert=True) for job_id, job in moves])
+                failed_moves = {moves[i][0]: moves[i][1] for i in failed}
+
+                changes = list(updates.items())
+                deletes = [job_id for job_id in dlq_moves if job_id not in failed_moves]
+                operations = [UpdateOne({"id": job_id}, {"$set": fields}) for job_id, fields in changes]
+                operations += [DeleteOne({"id": job_id}) for job_id in deletes]
+                failed = self._bulk_write(collection, operations)
+
+                failed_updates = {}
+                for i in failed:
+                    if i < len(changes):
+                        failed_updates[changes[i][0]] = changes[i][1]
+                    else:
+                        job_id = deletes[i - len(changes)]
+                        failed_moves[job_id] = dlq_moves[job_id]
+
+            except ConnectionFailure as e:
+                click.secho(f"Failed to flush {len(updates) + len(dlq_moves)} buffered job writes, retrying: {e}", fg="red")
+                self._requeue(updates, dlq_moves)
+                return
+            except Exception as e:
+                click.secho(f"Failed to flush {len(updates) + len(dlq_moves)} buffered job writes: {e}", fg="red")
+                failed_updates, failed_moves = updates, dlq_moves
+
+            with self.lock:
+                for job_id in {**updates, **dlq_moves}:
+                    if job_id not in failed_updates and job_id not in failed_moves:
+                        self.failures.pop(job_id, None)
+            self._requeue(failed_updates, failed_moves, count=True)
+
+    @staticmethod
+    def _bulk_write(target, operations):
+        """
+        Run an unordered bulk_write and return the indexes of the operations the server rejected.
+        """
+        if not operations:
+            return []
+        try:
+            target.bulk_write(operations, ordered=False)
+            return []
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            for error in errors:
+                click.secho(f"Buffered write rejected: {error.get('errmsg')}", fg="red")
+            return [error["index"] for error in errors]
+
+    def _requeue(self, updates, dlq_moves, count=False):
+        """
+        Put failed writes back in the buffer without overwriting newer ones.
+        With count set, each job is retried at most MAX_FLUSH_RETRIES times before it is dropped.
+        """
+        with self.lock:
+            for job_id, job in dlq_moves.items():
+                if count and not self._retry_allowed(job_id):
+                    continue
+                self.updates.pop(job_id, None)
+                self.dlq_moves.setdefault(job_id, job)
+            for job_id, fields in updates.items():
+                if job_id in self.dlq_moves or (count and not self._retry_allowed(job_id)):
+                    continue
+                self.updates[job_id] = {**fields, **self.updates.get(job_id, {})}
+
+    def _retry_allowed(self, job_id):
+        # Caller holds self.lock.
+        self.failures[job_id] = self.failures.get(job_id, 0) + 1
+        if self.failures[job_id] <= MAX_FLUSH_RETRIES:
+            return True
+        self.failures.pop(job_id)
+        click.secho(f"Dropping buffered writes for job {job_id} after {MAX_FLUSH_RETRIES} failed flushes", fg="red")
+        return False
+
+
+write_buffer = WriteBuffer()
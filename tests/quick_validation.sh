@@ -32,4 +32,10 @@ echo "5. Final Status"
 echo "queuectl status"
 queuectl status
 
+echo "6. Live Event Stream"
+echo "curl -sN --max-time 5 http://127.0.0.1:8000/events | grep -m1 '^event: status'"
+curl -sN --max-time 5 http://127.0.0.1:8000/events | grep -m1 '^event: status'
+echo "timeout 5 queuectl watch"
+timeout 5 queuectl watch
+
 echo "✅ Quick validation completed"
\ No newline at end of file
@@ -43,6 +43,12 @@ queuectl worker start --count 5
 sleep 8
 queuectl status
 
+# Test 8.2.1: Live Event Stream
+echo "8.2.1 - Live Event Stream"
+curl -sN --max-time 5 http://127.0.0.1:8000/events | grep -m1 '^event: status'
+queuectl enqueue '{"id": "watch_test", "command": "echo Watched"}'
+timeout 5 queuectl watch
+
 # Test 8.3: Mixed Workload Types
 echo "8.3 - Mixed Workload Types"
 queuectl enqueue '{"id": "mixed1", "command": "echo instant"}'
@@ -114,3 +120,47 @@ queuectl config set max_retries 4
 # Restart backend server here manually, then:
 queuectl config get max_retries  # Should still be 4
 
+echo ""
+echo "🧪 TEST SUITE: Server Shutdown"
+echo "==============================="
+
+# Test 11.1: Shutdown Stops Workers and Flushes Buffered Writes
+# Stops the API server while one job has just finished and another is still running,
+# then restarts it. Without the shutdown hook the running job would stay in 'processing'.
+echo "11.1 - Shutdown Stops Workers and Flushes Buffered Writes"
+SRC_DIR="$(cd "$(dirname "$0")/../src" && pwd)"
+queuectl enqueue '{"id": "shutdown_running", "command": "sleep 20"}'
+queuectl enqueue '{"id": "shutdown_done", "command": "echo done before shutdown"}'
+queuectl worker start --count 2
+
+for i in {1..60}; do
+    queuectl list --state processing | grep -q "ID: shutdown_running" && break
+    sleep 1
+done
+for i in {1..60}; do
+    queuectl list --state completed | grep -q "ID: shutdown_done" && break
+    sleep 1
+done
+
+pkill -INT -f "uvicorn base:app"
+for i in {1..30}; do
+    pgrep -f "uvicorn base:app" > /dev/null || break
+    sleep 1
+done
+
+(cd "$SRC_DIR" && uvicorn base:app > /dev/null 2>&1 &)
+for i in {1..30}; do
+    curl -s http://127.0.0.1:8000/status > /dev/null && break
+    sleep 1
+done
+
+if queuectl list --state completed | grep -q "ID: shutdown_done"; then
+    echo "✅ shutdown_done recorded as completed"
+else
+    echo "❌ shutdown_done not recorded as completed"
+fi
+if queuectl list --state pending | grep -q "ID: shutdown_running"; then
+    echo "✅ shutdown_running reset to pending"
+else
+    echo "❌ shutdown_running not reset to pending"
+fi